@@ -1,7 +1,10 @@
-use actix_web::{get, web, HttpResponse, Responder};
+use actix_files::NamedFile;
+use actix_web::{get, web, HttpRequest, HttpResponse, Responder};
 use chrono::Utc;
-use image::{GenericImageView, guess_format};
+use image::{io::Reader, ImageFormat};
 use serde::Serialize;
+use std::fs::File;
+use std::io::{self, BufReader, ErrorKind};
 use std::path::PathBuf;
 
 #[derive(Serialize)]
@@ -19,6 +22,19 @@ pub struct ImageInfo {
     pub dimensions: Option<(u32, u32)>,
 }
 
+/// Lookup errors caused by the requested name rather than the filesystem,
+/// e.g. a name that is too long or contains a NUL byte. These are reported
+/// as a missing image; anything else is a real I/O failure.
+fn is_missing(err: &io::Error) -> bool {
+    matches!(
+        err.kind(),
+        ErrorKind::NotFound
+            | ErrorKind::InvalidInput
+            | ErrorKind::InvalidFilename
+            | ErrorKind::NotADirectory
+    )
+}
+
 #[get("/health")]
 pub async fn health_check() -> impl Responder {
     let response = HealthResponse {
@@ -31,19 +47,19 @@ pub async fn health_check() -> impl Responder {
 
 #[get("/images/{filename}")]
 pub async fn serve_image(
+    req: HttpRequest,
     filename: web::Path<String>,
     images_dir: web::Data<PathBuf>,
 ) -> impl Responder {
     let path = images_dir.join(filename.as_ref());
-    
-    if !path.exists() {
-        return HttpResponse::NotFound().body("Image not found");
-    }
 
-    match std::fs::read(&path) {
-        Ok(contents) => HttpResponse::Ok()
-            .content_type("image/jpeg") // You might want to make this dynamic based on the file type
-            .body(contents),
+    // Stream the file in chunks rather than buffering it whole in memory
+    match NamedFile::open_async(&path).await {
+        // NamedFile keeps the metadata from open, so this costs no extra stat
+        Ok(file) if !file.metadata().is_file() => HttpResponse::NotFound().body("Image not found"),
+        // Content-Type comes from NamedFile's static extension table
+        Ok(file) => file.into_response(&req),
+        Err(e) if is_missing(&e) => HttpResponse::NotFound().body("Image not found"),
         Err(_) => HttpResponse::InternalServerError().body("Failed to read image"),
     }
 }
@@ -54,22 +70,50 @@ pub async fn image_info(
     images_dir: web::Data<PathBuf>,
 ) -> impl Responder {
     let path = images_dir.join(filename.as_ref());
-    
-    if !path.exists() {
-        return HttpResponse::NotFound().body("Image not found");
-    }
 
-    let metadata = match std::fs::metadata(&path) {
-        Ok(m) => m,
-        Err(_) => return HttpResponse::InternalServerError().body("Failed to read image metadata"),
-    };
+    // Stat, read and decode all block, so keep them off the async workers
+    let probed = web::block(move || {
+        // A single stat both checks existence and yields the size
+        let metadata = std::fs::metadata(&path)?;
+        if !metadata.is_file() {
+            return Err(io::Error::from(ErrorKind::NotFound));
+        }
 
-    let format = guess_format(&std::fs::read(&path).unwrap_or_default()).ok();
-    let dimensions = image::open(&path).ok().map(|img| img.dimensions());
+        // One open serves both format sniffing and the header read
+        let reader =
+            File::open(&path).and_then(|f| Reader::new(BufReader::new(f)).with_guessed_format());
+        let (format, dimensions) = match reader {
+            Ok(mut reader) => {
+                // Report the sniffed format only, but fall back to the file
+                // extension for the decoder (as image::open did) so formats
+                // without magic bytes, such as TGA, still yield dimensions
+                let format = reader.format();
+                if format.is_none() {
+                    if let Ok(by_extension) = ImageFormat::from_path(&path) {
+                        reader.set_format(by_extension);
+                    }
+                }
+                // Dimensions live in the header; no need to decode pixels
+                let dimensions = reader.into_dimensions().ok();
+                (format, dimensions)
+            }
+            Err(_) => (None, None),
+        };
+        Ok((metadata.len(), format, dimensions))
+    })
+    .await;
+    let (size_bytes, format, dimensions) = match probed {
+        Ok(Ok(p)) => p,
+        Ok(Err(e)) if is_missing(&e) => return HttpResponse::NotFound().body("Image not found"),
+        Ok(Err(_)) => {
+            return HttpResponse::InternalServerError().body("Failed to read image metadata")
+        }
+        Err(_) => return HttpResponse::InternalServerError().body("Failed to read image"),
+    };
 
     let info = ImageInfo {
         filename: filename.to_string(),
-        size_bytes: metadata.len(),
+        size_bytes,
         format: format.map(|f| format!("{:?}", f)),
         dimensions,
     };
@@ -44,4 +44,147 @@ mod tests {
         let resp = test::call_service(&app, req).await;
         assert!(resp.status().is_success());
     }
+
+    #[actix_rt::test]
+    async fn test_serve_image_content_type() {
+        let temp = assert_fs::TempDir::new().unwrap();
+        let test_image = temp.child("test.png");
+        test_image.write_binary(b"fake image content").unwrap();
+
+        let app = test::init_service(
+            App::new()
+                .app_data(web::Data::new(temp.path().to_path_buf()))
+                .service(serve_image)
+        ).await;
+
+        let req = test::TestRequest::get()
+            .uri("/images/test.png")
+            .to_request();
+
+        let resp = test::call_service(&app, req).await;
+        assert!(resp.status().is_success());
+        assert_eq!(resp.headers().get("content-type").unwrap(), "image/png");
+    }
+
+    #[actix_rt::test]
+    async fn test_image_info() {
+        let temp = assert_fs::TempDir::new().unwrap();
+        let test_image = temp.child("test.jpg");
+        test_image.write_binary(b"fake image content").unwrap();
+
+        let app = test::init_service(
+            App::new()
+                .app_data(web::Data::new(temp.path().to_path_buf()))
+                .service(image_info)
+        ).await;
+
+        let req = test::TestRequest::get()
+            .uri("/images/test.jpg/info")
+            .to_request();
+
+        let resp = test::call_service(&app, req).await;
+        assert!(resp.status().is_success());
+    }
+
+    #[actix_rt::test]
+    async fn test_serve_image_not_found() {
+        let temp = assert_fs::TempDir::new().unwrap();
+
+        let app = test::init_service(
+            App::new()
+                .app_data(web::Data::new(temp.path().to_path_buf()))
+                .service(serve_image)
+        ).await;
+
+        let req = test::TestRequest::get()
+            .uri("/images/nonexistent.jpg")
+            .to_request();
+
+        let resp = test::call_service(&app, req).await;
+        assert_eq!(resp.status(), 404);
+    }
+
+    #[actix_rt::test]
+    async fn test_serve_image_name_too_long() {
+        let temp = assert_fs::TempDir::new().unwrap();
+
+        let app = test::init_service(
+            App::new()
+                .app_data(web::Data::new(temp.path().to_path_buf()))
+                .service(serve_image)
+        ).await;
+
+        let req = test::TestRequest::get()
+            .uri(&format!("/images/{}.jpg", "a".repeat(300)))
+            .to_request();
+
+        let resp = test::call_service(&app, req).await;
+        assert_eq!(resp.status(), 404);
+    }
+
+    #[actix_rt::test]
+    async fn test_image_info_not_found() {
+        let temp = assert_fs::TempDir::new().unwrap();
+
+        let app = test::init_service(
+            App::new()
+                .app_data(web::Data::new(temp.path().to_path_buf()))
+                .service(image_info)
+        ).await;
+
+        let req = test::TestRequest::get()
+            .uri("/images/nonexistent.jpg/info")
+            .to_request();
+
+        let resp = test::call_service(&app, req).await;
+        assert_eq!(resp.status(), 404);
+    }
+
+    #[actix_rt::test]
+    async fn test_directory_is_not_an_image() {
+        let temp = assert_fs::TempDir::new().unwrap();
+        temp.child("subdir").create_dir_all().unwrap();
+
+        let app = test::init_service(
+            App::new()
+                .app_data(web::Data::new(temp.path().to_path_buf()))
+                .service(image_info)
+                .service(serve_image)
+        ).await;
+
+        let req = test::TestRequest::get()
+            .uri("/images/subdir")
+            .to_request();
+        let resp = test::call_service(&app, req).await;
+        assert_eq!(resp.status(), 404);
+
+        let req = test::TestRequest::get()
+            .uri("/images/subdir/info")
+            .to_request();
+        let resp = test::call_service(&app, req).await;
+        assert_eq!(resp.status(), 404);
+    }
+
+    #[actix_rt::test]
+    async fn test_image_info_dimensions_without_magic_bytes() {
+        let temp = assert_fs::TempDir::new().unwrap();
+        // Minimal uncompressed 24-bit 2x3 TGA: 18-byte header, then pixels
+        let mut tga = vec![0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 3, 0, 24, 0];
+        tga.extend_from_slice(&[0u8; 2 * 3 * 3]);
+        temp.child("test.tga").write_binary(&tga).unwrap();
+
+        let app = test::init_service(
+            App::new()
+                .app_data(web::Data::new(temp.path().to_path_buf()))
+                .service(image_info)
+        ).await;
+
+        let req = test::TestRequest::get()
+            .uri("/images/test.tga/info")
+            .to_request();
+
+        let body = test::call_and_read_body(&app, req).await;
+        let body = std::str::from_utf8(&body).unwrap();
+        assert!(body.contains("\"dimensions\":[2,3]"));
+    }
 }